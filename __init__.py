@@ -10,7 +10,7 @@ Smart wallet provider agnostic.
 from smart_account import TacoSmartWalletService, create_taco_smart_wallet_service
 
 # Configuration
-from config import SmartAccountConfig
+from config import SmartAccountConfig, get_config
 
 # Individual components for advanced usage
 from bundler import BundlerClient, convert_user_operation_to_pimlico_format
@@ -23,6 +23,7 @@ __all__ = [
     "TacoSmartWalletService",
     "create_taco_smart_wallet_service",
     "SmartAccountConfig",
+    "get_config",
     "BundlerClient",
     "PorterSignatureService",
     "create_eth_transfer_user_operation",
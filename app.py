@@ -12,16 +12,28 @@ import logging
 import os
 import threading
 import re
+import time
 import asyncio
-from typing import Dict, Any, Optional
-
-import requests
+import functools
+from decimal import Decimal, InvalidOperation
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Coroutine, Optional, Tuple
+
+import httpx
+import orjson
+import uvicorn
+import uvloop
+from a2wsgi import WSGIMiddleware
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 from flask import Flask, request, jsonify, abort
-from nacl.exceptions import BadSignatureError
-from nacl.signing import VerifyKey
+from flask.json.provider import JSONProvider
+from web3 import Web3
+from werkzeug.exceptions import HTTPException
 
 from smart_account import TacoSmartWalletService
-from config import SmartAccountConfig
+from config import get_config
+from porter import DISCORD_CONTEXT
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +43,14 @@ logger = logging.getLogger(__name__)
 DISCORD_WEBHOOK_BASE_URL = "https://discord.com/api/v10/webhooks"
 DISCORD_SIGNATURE_HEADER = "X-Signature-Ed25519"
 DISCORD_TIMESTAMP_HEADER = "X-Signature-Timestamp"
+DISCORD_MAX_TIMESTAMP_SKEW_SECONDS = 60
+DISCORD_MAX_BODY_BYTES = 64 * 1024
+
+# Discord webhook delivery
+DISCORD_WEBHOOK_QUEUE_SIZE = 1000
+DISCORD_WEBHOOK_WORKERS = 4
+DISCORD_WEBHOOK_MAX_RETRIES = 3
+DISCORD_WEBHOOK_BACKOFF_SECONDS = 1.0
 
 # Discord interaction types
 DISCORD_PING_TYPE = 1
@@ -41,35 +61,89 @@ DISCORD_DEFERRED_RESPONSE_TYPE = 5
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8080
 
+# Safety limit on a single tip
+MAX_TIP_ETH = Decimal(100)
+
+# Tip recipient formats
+_MENTION_RE = re.compile(r"^<@!?(\d+)>$")
+_ADDRESS_RE = re.compile(r"^0x[a-fA-F0-9]{40}$")
+
+# Worker threads serving Flask requests under the ASGI server
+HTTP_WORKER_THREADS = 10
+
+# Worker threads for blocking calls made from the tip event loop
+TIP_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
 
 
 
 
-def get_discord_public_key() -> str:
-    """Get Discord bot public key from environment variable"""
+@functools.lru_cache(maxsize=None)
+def get_discord_public_key() -> bytes:
+    """Get decoded Discord bot public key from environment variable"""
     key = os.environ.get('DISCORD_BOT_PUBLIC_KEY')
     if not key:
         raise ValueError("DISCORD_BOT_PUBLIC_KEY environment variable is required")
-    return key
+    try:
+        return bytes.fromhex(key)
+    except ValueError as e:
+        raise ValueError("DISCORD_BOT_PUBLIC_KEY must be a hex-encoded Ed25519 public key") from e
 
 
-def send_discord_response(app_id: str, token: str, content: str) -> None:
-    """Send a response back to Discord"""
-    try:
-        url = f"{DISCORD_WEBHOOK_BASE_URL}/{app_id}/{token}"
-        response = requests.post(url, json={"content": content}, timeout=30)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        logger.error(f"Failed to send Discord response: {e}")
+# Discord verify key, decoded once at import instead of per request
+_DISCORD_VERIFY_KEY = Ed25519PublicKey.from_public_bytes(get_discord_public_key())
+
+# Shared async HTTP/2 client so Discord webhook calls reuse pooled connections
+_ASYNC_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+)
+
+
+async def send_discord_response(app_id: str, token: str, content: str) -> None:
+    """Send a response back to Discord, backing off on rate limits and transient errors"""
+    url = f"{DISCORD_WEBHOOK_BASE_URL}/{app_id}/{token}"
+    for attempt in range(DISCORD_WEBHOOK_MAX_RETRIES + 1):
+        delay = DISCORD_WEBHOOK_BACKOFF_SECONDS * 2 ** attempt
+        try:
+            response = await _ASYNC_CLIENT.post(url, json={"content": content}, timeout=30)
+            if response.status_code == 429:
+                # Honor Discord's rate limit window before retrying
+                delay = float(response.headers.get("Retry-After", delay))
+                logger.warning(f"Discord rate limited response, retrying in {delay}s")
+            elif response.is_server_error:
+                logger.warning(f"Discord response attempt {attempt + 1} failed: HTTP {response.status_code}")
+            else:
+                response.raise_for_status()
+                return
+        except httpx.HTTPStatusError as e:
+            # Other client errors won't succeed on retry
+            logger.error(f"Failed to send Discord response: {e}")
+            return
+        except httpx.HTTPError as e:
+            logger.warning(f"Discord response attempt {attempt + 1} failed: {e}")
+
+        if attempt < DISCORD_WEBHOOK_MAX_RETRIES:
+            await asyncio.sleep(delay)
 
+    logger.error(f"Failed to send Discord response after {DISCORD_WEBHOOK_MAX_RETRIES + 1} attempts")
 
-def verify_discord_signature(signature: str, timestamp: str, body: str) -> None:
+
+def verify_discord_signature(signature: str, timestamp: str, body: bytes) -> None:
     """Verify Discord request signature"""
+    # Cheaply reject stale requests before the Ed25519 verify
     try:
-        verify_key = VerifyKey(key=bytes.fromhex(get_discord_public_key()))
-        signed_message = f"{timestamp}{body}".encode("utf-8")
-        verify_key.verify(smessage=signed_message, signature=bytes.fromhex(signature))
-    except BadSignatureError:
+        request_time = int(timestamp)
+    except ValueError:
+        abort(code=401, description="Invalid request timestamp")
+    if abs(time.time() - request_time) > DISCORD_MAX_TIMESTAMP_SKEW_SECONDS:
+        logger.warning("Stale Discord request timestamp")
+        abort(code=401, description="Stale request timestamp")
+
+    try:
+        signed_message = timestamp.encode("ascii") + body
+        _DISCORD_VERIFY_KEY.verify(bytes.fromhex(signature), signed_message)
+    except InvalidSignature:
         logger.warning("Invalid Discord signature")
         abort(code=401, description="Invalid request signature")
     except Exception as e:
@@ -77,6 +151,25 @@ def verify_discord_signature(signature: str, timestamp: str, body: str) -> None:
         abort(code=500, description="Internal server error")
 
 
+def _log_background_failure(future: Future) -> None:
+    """Log the exception of a finished background future, which nothing else retrieves"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background task failed: {error!r}", exc_info=error)
+
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 def extract_user_id(payload: Dict[str, Any]) -> str:
     """Extract Discord user ID from interaction payload"""
     # Try guild interactions first
@@ -90,30 +183,42 @@ def extract_user_id(payload: Dict[str, Any]) -> str:
     raise Exception("Missing user ID in Discord interaction")
 
 
+@functools.lru_cache(maxsize=4096)
+def _address_from_user(handle: str) -> str:
+    """Derive a stable placeholder address for a Discord user handle"""
+    return "0x" + bytes(Web3.keccak(handle.encode("utf-8")))[-20:].hex()
+
+
 def parse_tip_request(amount: str, recipient: str) -> Dict[str, Any]:
     """Parse and validate tip request parameters"""
-    # Validate amount
+    # Validate the exact value that is transferred; float would drift from the wei amount
     try:
-        amount_float = float(amount)
-        if amount_float <= 0:
-            return {"error": "❌ Amount must be greater than 0"}
-        if amount_float > 100:  # Safety limit
-            return {"error": "❌ Safety limit: Maximum tip amount is 100 ETH"}
-    except ValueError:
+        amount_eth = Decimal(amount)
+    except (InvalidOperation, TypeError):
+        return {"error": "❌ Invalid amount format. Please use decimal format (e.g., 0.01)"}
+    if not amount_eth.is_finite():
         return {"error": "❌ Invalid amount format. Please use decimal format (e.g., 0.01)"}
+    if amount_eth <= 0:
+        return {"error": "❌ Amount must be greater than 0"}
+    if amount_eth > MAX_TIP_ETH:
+        return {"error": "❌ Safety limit: Maximum tip amount is 100 ETH"}
+    amount_wei = Web3.to_wei(amount_eth, 'ether')
+    if amount_wei == 0:
+        return {"error": "❌ Amount is smaller than 1 wei"}
 
     # Parse recipient
-    if re.match(r"^<@!?(\d+)>$", recipient):
+    mention = _MENTION_RE.match(recipient)
+    if mention:
         # Discord user mention
-        user_id = re.sub(r"^<@!?(\d+)>$", r"\1", recipient)
-        recipient_address = f"0x{hash(user_id) % (16**40):040x}"
+        user_id = mention.group(1)
+        recipient_address = _address_from_user(user_id)
         recipient_display = f"<@{user_id}>"
     elif recipient.startswith("@"):
         # @username format
         username = recipient[1:]
-        recipient_address = f"0x{hash(username) % (16**40):040x}"
+        recipient_address = _address_from_user(username)
         recipient_display = f"@{username}"
-    elif re.match(r"^0x[a-fA-F0-9]{40}$", recipient):
+    elif _ADDRESS_RE.match(recipient):
         # Ethereum address
         recipient_address = recipient.lower()
         recipient_display = f"{recipient[:6]}...{recipient[-4:]}"
@@ -122,6 +227,7 @@ def parse_tip_request(amount: str, recipient: str) -> Dict[str, Any]:
 
     return {
         "amount": amount,
+        "amount_wei": amount_wei,
         "recipient_address": recipient_address,
         "recipient_display": recipient_display
     }
@@ -132,31 +238,75 @@ class DiscordInteractionHandler:
 
     def __init__(self):
         self.app = Flask(__name__)
-        self.taco_service = TacoSmartWalletService(SmartAccountConfig())
+        self.app.json = _OrjsonProvider(self.app)
+        # Reject oversized bodies with 413 from Content-Length before any of it is read
+        self.app.config["MAX_CONTENT_LENGTH"] = DISCORD_MAX_BODY_BYTES
+        self.taco_service = TacoSmartWalletService(get_config())
+        self._loop = self._start_event_loop()
+        self._webhook_queue: asyncio.Queue[Tuple[str, str, str]] = asyncio.Queue(maxsize=DISCORD_WEBHOOK_QUEUE_SIZE)
+        for _ in range(DISCORD_WEBHOOK_WORKERS):
+            self._run_in_background(self._webhook_worker())
+        self._run_in_background(self.taco_service.run_background_tasks())
         self._setup_routes()
 
+    def _start_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the long-lived uvloop event loop that runs tip operations"""
+        loop = uvloop.new_event_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=TIP_EXECUTOR_MAX_WORKERS))
+        threading.Thread(target=loop.run_forever, name="tip-event-loop", daemon=True).start()
+        return loop
+
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]) -> Future:
+        """Schedule a coroutine on the tip event loop, logging any exception it escapes with"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(_log_background_failure)
+        return future
+
+    def _queue_discord_response(self, app_id: str, token: str, content: str) -> None:
+        """Queue a Discord response for background delivery"""
+        try:
+            self._webhook_queue.put_nowait((app_id, token, content))
+        except asyncio.QueueFull:
+            logger.error("Discord response queue full, dropping response")
+
+    async def _webhook_worker(self) -> None:
+        """Deliver queued Discord responses"""
+        while True:
+            app_id, token, content = await self._webhook_queue.get()
+            try:
+                await send_discord_response(app_id, token, content)
+            except Exception as e:
+                logger.error(f"Discord response worker error: {e}")
+            finally:
+                self._webhook_queue.task_done()
+
     def _setup_routes(self) -> None:
         """Set up Flask routes"""
         self.app.route("/interactions", methods=["POST"])(self.handle_interactions)
         self.app.route("/health", methods=["GET"])(self.health_check)
 
-    def _handle_tip(
+    async def _handle_tip(
         self, user_id: str, amount: str, recipient: str, interaction_token: str, 
-        application_id: str, body: str, timestamp: int, signature: str
+        application_id: str, body: bytes, timestamp: int, signature: str
     ) -> None:
         """Handle ETH tip operation for a specific user"""
         # Parse and validate request
         tip_data = parse_tip_request(amount, recipient)
         if "error" in tip_data:
-            send_discord_response(application_id, interaction_token, tip_data["error"])
+            self._queue_discord_response(application_id, interaction_token, tip_data["error"])
             return
 
         try:
             # Set Discord context for TACo signatures
             self._set_discord_context(timestamp, body, signature, user_id, amount, recipient)
-            
-            # Execute ETH transfer
-            result = self._execute_eth_transfer(user_id, tip_data)
+
+            # Execute ETH transfer using TACo threshold signatures
+            result = await self.taco_service.send_eth(
+                user_id=user_id,
+                recipient=tip_data['recipient_address'],
+                amount_wei=tip_data['amount_wei'],
+                amount_eth=tip_data['amount'],
+            )
             
             # Format and send response
             content = self._format_tip_response(result, tip_data, user_id)
@@ -165,9 +315,9 @@ class DiscordInteractionHandler:
             logger.error(f"TACo tip error for user {user_id}: {e}")
             content = self._format_error_response(e)
 
-        send_discord_response(application_id, interaction_token, content)
+        self._queue_discord_response(application_id, interaction_token, content)
     
-    def _set_discord_context(self, timestamp: int, body: str, signature: str, 
+    def _set_discord_context(self, timestamp: int, body: bytes, signature: str, 
                            user_id: str, amount: str, recipient: str) -> None:
         """Set Discord context for TACo signatures"""
         discord_context = {
@@ -179,25 +329,10 @@ class DiscordInteractionHandler:
             'amount': amount,
             'recipient': recipient
         }
-        threading.current_thread().discord_context = discord_context
+        # Each tip runs in its own task, so the context stays isolated across awaits
+        DISCORD_CONTEXT.set(discord_context)
         logger.info(f"Set Discord context for TACo: tip {amount} ETH to {recipient}")
     
-    def _execute_eth_transfer(self, user_id: str, tip_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute ETH transfer using TACo threshold signatures"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(
-            self.taco_service.send_eth(
-                user_id=user_id,
-                recipient=tip_data['recipient_address'],
-                amount_eth=float(tip_data['amount']),
-            )
-        )
-    
     def _format_tip_response(self, result: Dict[str, Any], tip_data: Dict[str, Any], user_id: str) -> str:
         """Format tip response message"""
         if result.get('success', False):
@@ -236,12 +371,12 @@ class DiscordInteractionHandler:
     def handle_interactions(self):
         """Handle incoming Discord interactions"""
         try:
-            payload = request.json
             signature = request.headers[DISCORD_SIGNATURE_HEADER]
             timestamp = request.headers[DISCORD_TIMESTAMP_HEADER]
-            body = request.data.decode("utf-8")
+            body = request.get_data(cache=True)
 
             verify_discord_signature(signature, timestamp, body)
+            payload = orjson.loads(body)
 
             # Handle PING
             if payload.get("type") == DISCORD_PING_TYPE:
@@ -252,11 +387,13 @@ class DiscordInteractionHandler:
                 return self._handle_slash_command(payload, signature, timestamp, body)
 
             return "", 204
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Interaction handling error: {e}")
             return jsonify({"error": "Internal server error"}), 500
 
-    def _handle_slash_command(self, payload: Dict[str, Any], signature: str, timestamp: str, body: str):
+    def _handle_slash_command(self, payload: Dict[str, Any], signature: str, timestamp: str, body: bytes):
         """Handle Discord slash commands"""
         data = payload.get("data", {})
         command_name = data.get("name")
@@ -270,12 +407,11 @@ class DiscordInteractionHandler:
         amount = next((opt["value"] for opt in options if opt["name"] == "amount"), "")
         recipient = next((opt["value"] for opt in options if opt["name"] == "recipient"), "")
         
-        # Handle tip in background thread
-        threading.Thread(
-            target=self._handle_tip,
-            args=(user_id, amount, recipient, payload["token"], payload["application_id"], 
-                  body, timestamp, signature)
-        ).start()
+        # Handle tip on the background event loop
+        self._run_in_background(
+            self._handle_tip(user_id, amount, recipient, payload["token"], payload["application_id"],
+                             body, timestamp, signature)
+        )
         
         return jsonify({"type": DISCORD_DEFERRED_RESPONSE_TYPE})
 
@@ -284,8 +420,15 @@ class DiscordInteractionHandler:
         return "OK", 200
 
     def run(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
-        """Run the Flask application"""
-        self.app.run(host=host, port=port)
+        """Serve the Flask application with uvicorn"""
+        uvicorn.run(
+            WSGIMiddleware(self.app, workers=HTTP_WORKER_THREADS),
+            host=host,
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            workers=1,
+        )
 
 
 if __name__ == "__main__":
@@ -2,16 +2,53 @@
 Pimlico bundler integration and format conversion utilities for TACo smart wallets
 """
 
+import functools
 import logging
-from typing import List, Dict, Optional, Union
-import requests
+import operator
+import threading
+import time
+from typing import List, Dict, Optional, Tuple, Union
+import httpx
+import orjson
 from nucypher_core import UserOperation
 
-from config import SmartAccountConfig
+from config import DEFAULT_GAS_LIMITS, DEFAULT_GAS_LIMITS_HEX, SmartAccountConfig
 from user_operations import SignedUserOperation
 
 logger = logging.getLogger(__name__)
 
+# Integer UserOperation fields sent to the bundler as hex, keyed by Pimlico field name
+_HEX_FIELD_NAMES = (
+    "nonce",
+    "callGasLimit",
+    "verificationGasLimit",
+    "preVerificationGas",
+    "maxFeePerGas",
+    "maxPriorityFeePerGas",
+)
+_get_hex_fields = operator.attrgetter(
+    "nonce",
+    "call_gas_limit",
+    "verification_gas_limit",
+    "pre_verification_gas",
+    "max_fee_per_gas",
+    "max_priority_fee_per_gas",
+)
+
+# Hex strings for default gas values, which unoptimized UserOperations carry unchanged
+_DEFAULT_GAS_HEX = {DEFAULT_GAS_LIMITS[name]: value for name, value in DEFAULT_GAS_LIMITS_HEX.items()}
+
+
+def _to_hex(value: int) -> str:
+    """Hex-encode an integer field, reusing precomputed strings for default gas values"""
+    return _DEFAULT_GAS_HEX.get(value) or hex(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _bytes_to_hex(data: bytes) -> str:
+    """Hex-encode calldata, memoized since estimate and send carry the same bytes"""
+    return "0x" + data.hex()
+
 
 def convert_user_operation_to_pimlico_format(
     user_op: Union[UserOperation, SignedUserOperation],
@@ -26,16 +63,12 @@ def convert_user_operation_to_pimlico_format(
         op = user_op
 
     # Build pimlico dict from direct attribute access
+    call_data = op.call_data
     pimlico_dict = {
         "sender": op.sender,
-        "nonce": hex(op.nonce),
-        "callData": "0x" + op.call_data.hex() if isinstance(op.call_data, bytes) else op.call_data,
-        "callGasLimit": hex(op.call_gas_limit),
-        "verificationGasLimit": hex(op.verification_gas_limit),
-        "preVerificationGas": hex(op.pre_verification_gas),
-        "maxFeePerGas": hex(op.max_fee_per_gas),
-        "maxPriorityFeePerGas": hex(op.max_priority_fee_per_gas),
+        "callData": _bytes_to_hex(call_data) if type(call_data) is bytes else call_data,
     }
+    pimlico_dict.update(zip(_HEX_FIELD_NAMES, map(_to_hex, _get_hex_fields(op))))
 
     # Add signature
     if signature:
@@ -75,25 +108,58 @@ class BundlerClient:
     
     def __init__(self, config: SmartAccountConfig):
         self.config = config
+
+        # Persistent HTTP/2 client so concurrent bundler RPCs share one keep-alive connection
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_connections=20, keepalive_expiry=60),
+            timeout=30
+        )
+
+        # Gas prices move on the order of seconds, so reuse them briefly across UserOperations
+        self._gas_price_cache: Optional[Tuple[float, Dict]] = None
+        self._gas_price_lock = threading.Lock()
     
-    def estimate_user_operation_gas(self, user_operation: UserOperation) -> Optional[Dict]:
+    async def estimate_user_operation_gas(self, user_operation: UserOperation) -> Optional[Dict]:
         """Estimate gas for UserOperation using Pimlico API"""
-        user_op_dict = convert_user_operation_to_pimlico_format(user_operation)
-        user_op_dict['signature'] = "0x" + "0" * 130  # Dummy signature
-        
-        return self._make_bundler_request("eth_estimateUserOperationGas", [user_op_dict, self.config.entry_point_address])
+        return await self._make_bundler_request("eth_estimateUserOperationGas", self._estimate_params(user_operation))
     
-    def get_user_operation_gas_price(self) -> Optional[Dict]:
+    async def get_user_operation_gas_price(self) -> Optional[Dict]:
         """Get current gas prices from Pimlico"""
-        return self._make_bundler_request("pimlico_getUserOperationGasPrice", [])
+        gas_prices = self._get_cached_gas_price()
+        if gas_prices is None:
+            gas_prices = await self._make_bundler_request("pimlico_getUserOperationGasPrice", [])
+            self._cache_gas_price(gas_prices)
+        return gas_prices
+
+    def _get_cached_gas_price(self) -> Optional[Dict]:
+        """Return cached gas prices if still within the configured TTL"""
+        with self._gas_price_lock:
+            cache = self._gas_price_cache
+            if cache and time.monotonic() - cache[0] < self.config.gas_price_ttl_seconds:
+                return cache[1]
+            return None
+
+    def _cache_gas_price(self, gas_prices: Optional[Dict]) -> None:
+        """Cache successfully fetched gas prices"""
+        if gas_prices:
+            with self._gas_price_lock:
+                self._gas_price_cache = (time.monotonic(), gas_prices)
+
+    def _estimate_params(self, user_operation: UserOperation) -> List:
+        """Build eth_estimateUserOperationGas params for an unsigned UserOperation"""
+        user_op_dict = convert_user_operation_to_pimlico_format(user_operation)
+        user_op_dict['signature'] = "0x" + "0" * 130  # Dummy signature
+        return [user_op_dict, self.config.entry_point_address]
     
-    def send_user_operation(self, signed_user_op: SignedUserOperation) -> Dict:
+    async def send_user_operation(self, signed_user_op: SignedUserOperation) -> Dict:
         """Send SignedUserOperation to bundler and return result"""
         logger.info("Sending UserOperation to bundler...")
 
         user_op_dict = convert_user_operation_to_pimlico_format(signed_user_op)
-        logger.info(f"Full UserOp to bundler: {user_op_dict}")
-        result = self._make_bundler_request("eth_sendUserOperation", [user_op_dict, self.config.entry_point_address])
+        logger.debug("Full UserOp to bundler: %s", user_op_dict)
+        result = await self._make_bundler_request("eth_sendUserOperation", [user_op_dict, self.config.entry_point_address])
         
         if result:
             logger.info(f"UserOperation sent successfully: {result}")
@@ -109,35 +175,36 @@ class BundlerClient:
                 'status': 'failed'
             }
     
-    def _make_bundler_request(self, method: str, params: List) -> Optional[Dict]:
+    async def _make_bundler_request(self, method: str, params: List) -> Optional[Dict]:
         """Make JSON-RPC request to bundler"""
-        payload = {
+        try:
+            response = await self._client.post(self.config.bundler_url, content=self._build_payload(method, params))
+            return self._parse_response(response)
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            return None
+
+    @staticmethod
+    def _build_payload(method: str, params: List) -> bytes:
+        """Build serialized JSON-RPC payload for bundler"""
+        return orjson.dumps({
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
             "id": 1
-        }
-        
-        try:
-            response = requests.post(
-                self.config.bundler_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'result' in result:
-                    return result['result']
-                elif 'error' in result:
-                    error = result['error']
-                    logger.error(f"Bundler error: {error.get('message', 'Unknown error')}")
-                    return None
-            else:
-                logger.error(f"HTTP error: {response.status_code}")
+        })
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Optional[Dict]:
+        """Extract the JSON-RPC result from a bundler response"""
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            if 'result' in result:
+                return result['result']
+            elif 'error' in result:
+                error = result['error']
+                logger.error(f"Bundler error: {error.get('message', 'Unknown error')}")
                 return None
-                
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
+        else:
+            logger.error(f"HTTP error: {response.status_code}")
             return None 
\ No newline at end of file
@@ -2,8 +2,9 @@
 Configuration for TACo Smart Wallet operations
 """
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Network constants
 ENTRYPOINT_V07 = "0x0000000071727De22E5E9d8BAf0edAc6f37da032"
@@ -15,26 +16,48 @@ DEFAULT_GAS_LIMITS = {
     "pre_verification": 60000,
     "fee": 1100000
 }
+DEFAULT_GAS_LIMITS_HEX = {name: hex(value) for name, value in DEFAULT_GAS_LIMITS.items()}
 
+# Environment configuration, read once at import
+_COHORT_ID = os.environ.get('COHORT_ID')
+_ETH_ENDPOINT = os.environ.get('DEMO_L1_PROVIDER_URI', 'https://sepolia.drpc.org')
+_PIMLICO_API_KEY = os.environ.get('PIMLICO_API_KEY')
 
-@dataclass
+
+def _default_cohort_id() -> int:
+    """Get TACo cohort ID from environment"""
+    return int(_COHORT_ID)
+
+
+def _default_bundler_url() -> str:
+    """Build Pimlico bundler URL from environment"""
+    if not _PIMLICO_API_KEY:
+        raise ValueError("PIMLICO_API_KEY environment variable is required")
+    return f"https://api.pimlico.io/v2/base-sepolia/rpc?apikey={_PIMLICO_API_KEY}"
+
+
+@dataclass(frozen=True, slots=True)
 class SmartAccountConfig:
     """Configuration for TACo Smart Wallet operations"""
-    
-    def __init__(self):
-        # Network configuration
-        self.rpc_url = "https://sepolia.base.org"
-        self.chain_id = 84532
-        self.entry_point_address = ENTRYPOINT_V07
-        self.smart_account_address = "0x2a456304C6d79C91Ef8a02Bd87f85486d5d2d7E0"
-        
-        # TACo network configuration (via Porter gateway)
-        self.porter_url = "https://porter-lynx.nucypher.io"
-        self.cohort_id = int(os.environ.get('COHORT_ID'))
-        self.eth_endpoint = os.environ.get('DEMO_L1_PROVIDER_URI', 'https://sepolia.drpc.org')
-        
-        # Bundler configuration
-        pimlico_api_key = os.environ.get('PIMLICO_API_KEY')
-        if not pimlico_api_key:
-            raise ValueError("PIMLICO_API_KEY environment variable is required")
-        self.bundler_url = f"https://api.pimlico.io/v2/base-sepolia/rpc?apikey={pimlico_api_key}" 
\ No newline at end of file
+
+    # Network configuration
+    rpc_url: str = "https://sepolia.base.org"
+    chain_id: int = 84532
+    entry_point_address: str = ENTRYPOINT_V07
+    smart_account_address: str = "0x2a456304C6d79C91Ef8a02Bd87f85486d5d2d7E0"
+
+    # TACo network configuration (via Porter gateway)
+    porter_url: str = "https://porter-lynx.nucypher.io"
+    cohort_id: int = field(default_factory=_default_cohort_id)
+    eth_endpoint: str = _ETH_ENDPOINT
+
+    # Bundler configuration
+    bundler_url: str = field(default_factory=_default_bundler_url, repr=False)  # embeds API key
+    gas_price_ttl_seconds: float = 2.0
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> SmartAccountConfig:
+    """Get the shared TACo Smart Wallet configuration"""
+    return SmartAccountConfig()
+
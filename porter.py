@@ -2,11 +2,16 @@
 TACo threshold signature service via Porter gateway for NuCypher UserOperations
 """
 
+import asyncio
+import functools
 import logging
 import base64
-import threading
-from typing import List, Dict
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import List, Dict, Optional, Tuple
+import httpx
+import orjson
 
 import json
 
@@ -14,6 +19,7 @@ from nucypher_core import (
     AAVersion,
     Context,
     EncryptedThresholdSignatureResponse,
+    SessionSharedSecret,
     SessionStaticKey,
     SessionStaticSecret,
     SignatureResponse,
@@ -30,6 +36,26 @@ from hexbytes import HexBytes
 
 logger = logging.getLogger(__name__)
 
+# Discord interaction context for the TACo signing request, set per tip task
+DISCORD_CONTEXT: ContextVar[Dict] = ContextVar('discord_context')
+
+# Cohort membership changes on the order of hours, so signer lookups are reused for a while
+SIGNERS_CACHE_TTL_SECONDS = 300
+SIGNERS_REFRESH_INTERVAL_SECONDS = 120
+
+# Threads for per-signer ECDH and request encryption
+ENCRYPTION_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=None)
+def get_signing_coordinator_agent(eth_endpoint: str) -> SigningCoordinatorAgent:
+    """Get the shared SigningCoordinatorAgent for an endpoint, fetching the Lynx registry once"""
+    registry = ContractRegistry.from_latest_publication(domain=domains.LYNX)
+    return SigningCoordinatorAgent(
+        blockchain_endpoint=eth_endpoint,
+        registry=registry,
+    )
+
 
 class PorterSignatureService:
     """Handles signature requests to TACo network via Porter gateway for UserOperations using NuCypher threshold signatures"""
@@ -38,14 +64,26 @@ class PorterSignatureService:
         self.config = config
         self.threshold = threshold
 
-        # Set up SigningCoordinatorAgent for fetching cohort info with signing keys
-        registry = ContractRegistry.from_latest_publication(domain=domains.LYNX)
-        self.signing_coordinator_agent = SigningCoordinatorAgent(
-            blockchain_endpoint=config.eth_endpoint,
-            registry=registry,
+        # Persistent client so Porter TLS connections are reused across tips
+        self._client = httpx.AsyncClient(
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_connections=16, keepalive_expiry=60),
+            timeout=30
         )
 
-    async def sign_user_operation(self, user_operation: UserOperation, context: str) -> SignedUserOperation:
+        self._signers_cache: Optional[Tuple[float, Dict[str, SessionStaticKey]]] = None
+        self._signers_lock = asyncio.Lock()
+        self._encryption_executor = ThreadPoolExecutor(max_workers=ENCRYPTION_WORKERS)
+
+        # Shared SigningCoordinatorAgent for fetching cohort info with signing keys
+        self.signing_coordinator_agent = get_signing_coordinator_agent(config.eth_endpoint)
+
+    async def sign_user_operation(
+        self,
+        user_operation: UserOperation,
+        context: str,
+        signers_info: Optional[Dict[str, SessionStaticKey]] = None
+    ) -> SignedUserOperation:
         """Sign a UserOperation using TACo threshold signatures via Porter gateway"""
         logger.info(f"Signing UserOperation with TACo via Porter: {context}")
 
@@ -54,7 +92,7 @@ class PorterSignatureService:
         porter_context = Context(json.dumps({
             ":timestamp": discord_context['timestamp'],
             ":signature": discord_context['signature'],
-            ":discordPayload": discord_context["body"]
+            ":discordPayload": discord_context["body"].decode("utf-8")
         }))
 
         # Create signing request
@@ -66,47 +104,55 @@ class PorterSignatureService:
             context=porter_context
         )
         logger.info(f"UserOp details: sender={user_operation.sender}, nonce={user_operation.nonce}, chain_id={self.config.chain_id}")
-        logger.info(f"UserOp call_data: {user_operation.call_data.hex()[:40]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("UserOp call_data: %s...", user_operation.call_data.hex()[:40])
+
+        # Get cohort signers info with their public keys, unless already prefetched
+        if signers_info is None:
+            signers_info = await self.get_signers_info()
 
         # Get signatures from Porter
-        signatures = await self._request_signatures(signing_request)
+        signatures = await self._request_signatures(signing_request, signers_info)
 
         # Return SignedUserOperation with combined signature
         return self._create_signed_user_operation(user_operation, signatures)
     
     def _get_discord_context(self) -> Dict:
-        """Get Discord context from current thread"""
-        discord_context = getattr(threading.current_thread(), 'discord_context', None)
+        """Get Discord context for the current tip"""
+        discord_context = DISCORD_CONTEXT.get(None)
         if not discord_context:
             raise Exception("Discord context required for Porter signatures")
         return discord_context
     
-    async def _request_signatures(self, signing_request: UserOperationSignatureRequest) -> List[SignatureResponse]:
+    async def _request_signatures(
+        self,
+        signing_request: UserOperationSignatureRequest,
+        signers_info: Dict[str, SessionStaticKey]
+    ) -> List[SignatureResponse]:
         """Request threshold signatures from TACo network via Porter gateway using encrypted requests"""
         # Generate ephemeral keypair for e2e encryption
         requester_sk = SessionStaticSecret.random()
         requester_pk = requester_sk.public_key()
 
-        # Get cohort signers info with their public keys
-        signers_info = self._get_signers_info()
+        # Build encrypted signing requests and shared secrets for each signer concurrently
+        loop = asyncio.get_running_loop()
+        encrypted_results = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._encryption_executor,
+                self._encrypt_for_signer,
+                signing_request,
+                requester_sk,
+                requester_pk,
+                signer_public_key
+            )
+            for signer_public_key in signers_info.values()
+        ))
 
-        # Build encrypted signing requests and shared secrets for each signer
         encrypted_signing_requests = {}
         shared_secrets = {}
-
-        for ursula_address, signer_public_key in signers_info.items():
-            # Derive shared secret for this signer
-            shared_secret = requester_sk.derive_shared_secret(signer_public_key)
+        for ursula_address, (shared_secret, encrypted_request) in zip(signers_info, encrypted_results):
             shared_secrets[ursula_address] = shared_secret
-
-            # Encrypt the signing request
-            encrypted_request = signing_request.encrypt(
-                shared_secret=shared_secret,
-                requester_public_key=requester_pk
-            )
-            encrypted_signing_requests[ursula_address] = base64.b64encode(
-                bytes(encrypted_request)
-            ).decode()
+            encrypted_signing_requests[ursula_address] = encrypted_request
 
         # Send encrypted requests to Porter
         request_data = {
@@ -114,16 +160,11 @@ class PorterSignatureService:
             'threshold': self.threshold
         }
 
-        response = requests.post(
-            f"{self.config.porter_url}/sign",
-            json=request_data,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
+        response = await self._client.post(f"{self.config.porter_url}/sign", content=orjson.dumps(request_data))
         response.raise_for_status()
 
         # Process response
-        result = response.json()
+        result = orjson.loads(response.content)
         signing_results = result.get('result', {}).get('signing_results', {})
 
         if signing_results.get('errors'):
@@ -147,39 +188,93 @@ class PorterSignatureService:
             sig_response = encrypted_response.decrypt(
                 shared_secret=shared_secrets[ursula_address]
             )
-            logger.info(f"Provider {ursula_address} -> Signer {sig_response.signer}")
+            logger.debug("Provider %s -> Signer %s", ursula_address, sig_response.signer)
             signature_responses.append(sig_response)
 
-        # sort signature responses by signer
-        signature_responses = sorted(signature_responses, key=lambda r: int(r.signer, 16))
+        # sort signature responses by signer; fixed-width big-endian bytes order like the address integers
+        signature_responses.sort(key=lambda r: bytes.fromhex(r.signer.removeprefix("0x")))
 
         if not signature_responses:
             raise Exception("No valid signature responses from TACo network")
 
-        # Note: Not sorting - matching old behavior that was working
         logger.info(f"Got {len(signature_responses)} TACo threshold signatures")
-        for r in signature_responses:
-            sig_hex = bytes(r.signature).hex()
-            logger.info(f"Signer: {r.signer}, sig_type: {r.signature_type}")
-            logger.info(f"  Full hash signed: {r.hash.hex()}")
-            logger.info(f"  Full signature: {sig_hex}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for r in signature_responses:
+                logger.debug("Signer: %s, sig_type: %s", r.signer, r.signature_type)
+                logger.debug("  Full hash signed: %s", r.hash.hex())
+                logger.debug("  Full signature: %s", bytes(r.signature).hex())
         return signature_responses
 
+    @staticmethod
+    def _encrypt_for_signer(
+        signing_request: UserOperationSignatureRequest,
+        requester_sk: SessionStaticSecret,
+        requester_pk: SessionStaticKey,
+        signer_public_key: SessionStaticKey
+    ) -> Tuple[SessionSharedSecret, str]:
+        """Derive the shared secret for a signer and encrypt the signing request for it"""
+        shared_secret = requester_sk.derive_shared_secret(signer_public_key)
+        encrypted_request = signing_request.encrypt(
+            shared_secret=shared_secret,
+            requester_public_key=requester_pk
+        )
+        return shared_secret, base64.b64encode(bytes(encrypted_request)).decode('ascii')
+
     def _create_signed_user_operation(self, user_operation: UserOperation, signature_responses: List[SignatureResponse]) -> SignedUserOperation:
         """Create SignedUserOperation with combined signatures"""
         # Concatenate raw signature bytes (already sorted by signer)
         # Note: r.signature is already bytes, no need to convert
         combined_signature = b"".join([r.signature for r in signature_responses])
-        logger.info(f"Combined signature length: {len(combined_signature)}, hex: {combined_signature.hex()[:60]}...")
+        logger.info(f"Combined signature length: {len(combined_signature)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Combined signature hex: %s...", combined_signature.hex()[:60])
 
         return SignedUserOperation(
             user_operation=user_operation,
             signature=combined_signature
         )
 
-    def _get_signers_info(self) -> Dict[str, SessionStaticKey]:
+    async def get_signers_info(self) -> Dict[str, SessionStaticKey]:
         """Get cohort signers with their public keys for encrypted requests"""
-        signing_cohort = self.signing_coordinator_agent.get_signing_cohort(
+        signers_info = self._get_cached_signers_info()
+        if signers_info is not None:
+            return signers_info
+
+        # Lock so concurrent tips share a single refresh on cache miss
+        async with self._signers_lock:
+            signers_info = self._get_cached_signers_info()
+            if signers_info is None:
+                signers_info = await self._refresh_signers_info()
+            return signers_info
+
+    async def refresh_signers_forever(self) -> None:
+        """Keep the cohort signers cache warm so tips don't wait on the contract read"""
+        while True:
+            try:
+                async with self._signers_lock:
+                    await self._refresh_signers_info()
+            except Exception as e:
+                logger.error(f"Failed to refresh cohort signers: {e}")
+            await asyncio.sleep(SIGNERS_REFRESH_INTERVAL_SECONDS)
+
+    def _get_cached_signers_info(self) -> Optional[Dict[str, SessionStaticKey]]:
+        """Return cached cohort signers if still within the TTL"""
+        cache = self._signers_cache
+        if cache and time.monotonic() - cache[0] < SIGNERS_CACHE_TTL_SECONDS:
+            return cache[1]
+        return None
+
+    async def _refresh_signers_info(self) -> Dict[str, SessionStaticKey]:
+        """Fetch cohort signers and update the cache"""
+        signers_info = await self._fetch_signers_info()
+        self._signers_cache = (time.monotonic(), signers_info)
+        return signers_info
+
+    async def _fetch_signers_info(self) -> Dict[str, SessionStaticKey]:
+        """Read cohort signers and their public keys from the SigningCoordinator contract"""
+        # The agent's contract read is blocking, so keep it off the event loop
+        signing_cohort = await asyncio.to_thread(
+            self.signing_coordinator_agent.get_signing_cohort,
             self.config.cohort_id
         )
         logger.info(f"Cohort {self.config.cohort_id} has {len(signing_cohort.signers)} signers")
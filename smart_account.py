@@ -2,18 +2,28 @@
 Main TACo Smart Wallet service orchestration
 """
 
+import asyncio
 import logging
-from typing import Dict
+from typing import Dict, Optional
 from web3 import Web3
 from nucypher_core import UserOperation
 
-from config import SmartAccountConfig
+from config import SmartAccountConfig, get_config
 from bundler import BundlerClient
 from porter import PorterSignatureService
 from user_operations import create_eth_transfer_user_operation
 
 logger = logging.getLogger(__name__)
 
+# EntryPoint ABI subset for reading smart account nonces
+GET_NONCE_ABI = [{
+    "inputs": [{"name": "sender", "type": "address"}, {"name": "key", "type": "uint192"}],
+    "name": "getNonce",
+    "outputs": [{"name": "", "type": "uint256"}],
+    "stateMutability": "view",
+    "type": "function"
+}]
+
 
 class TacoSmartWalletService:
     """Main service for TACo-powered smart wallet operations"""
@@ -23,40 +33,63 @@ class TacoSmartWalletService:
         self.web3 = Web3(Web3.HTTPProvider(config.rpc_url))
         self.bundler_client = BundlerClient(config)
         self.porter_service = PorterSignatureService(config)
-        
-        logger.info(f"TACo smart wallet service initialized for {config.smart_account_address}")
 
-    async def send_eth(self, user_id: str, recipient: str, amount_eth: float) -> Dict:
-        """Send ETH from smart account to recipient"""
-        amount_wei = int(amount_eth * 10**18)
-        
-        # Validate balance
-        self._validate_balance(amount_wei, amount_eth)
-        
-        # Create and optimize UserOperation
-        user_operation = create_eth_transfer_user_operation(
-            smart_account=self.config.smart_account_address,
-            to_address=recipient,
-            amount_wei=amount_wei,
-            nonce=self._get_nonce()
+        # Addresses and contracts are fixed by config, so checksum and build them once
+        self._smart_account_checksum = Web3.to_checksum_address(config.smart_account_address)
+        self._entry_point_contract = self.web3.eth.contract(
+            address=Web3.to_checksum_address(config.entry_point_address),
+            abi=GET_NONCE_ABI
         )
         
-        user_operation = self._optimize_gas_settings(user_operation)
+        logger.info(f"TACo smart wallet service initialized for {config.smart_account_address}")
+
+    async def run_background_tasks(self) -> None:
+        """Run the service's long-lived maintenance loops; schedule once on the event loop"""
+        await self.porter_service.refresh_signers_forever()
+
+    async def send_eth(self, user_id: str, recipient: str, amount_wei: int, amount_eth: str) -> Dict:
+        """Send amount_wei from smart account to recipient; amount_eth is the display form"""
+        # Independent network reads start immediately and are awaited only where needed
+        balance_task = asyncio.create_task(self._validate_balance(amount_wei, amount_eth))
+        gas_price_task = asyncio.create_task(self.bundler_client.get_user_operation_gas_price())
+        signers_task = asyncio.create_task(self.porter_service.get_signers_info())
+        try:
+            # Create UserOperation, then estimate it while the other reads are in flight
+            user_operation = create_eth_transfer_user_operation(
+                smart_account=self.config.smart_account_address,
+                to_address=recipient,
+                amount_wei=amount_wei,
+                nonce=await self._get_nonce()
+            )
+            gas_prices, gas_estimates = await asyncio.gather(
+                gas_price_task,
+                self.bundler_client.estimate_user_operation_gas(user_operation),
+            )
+            user_operation = self._optimize_gas_settings(user_operation, gas_prices, gas_estimates)
+
+            await balance_task
+            signers_info = await signers_task
+        except BaseException:
+            pending_tasks = (balance_task, gas_price_task, signers_task)
+            for task in pending_tasks:
+                task.cancel()
+            # Retrieve every outcome so concurrent failures aren't logged as unretrieved
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+            raise
         
         # Sign and submit
         signed_user_operation = await self.porter_service.sign_user_operation(
-            user_operation, f"Send {amount_eth} ETH to {recipient}"
+            user_operation, f"Send {amount_eth} ETH to {recipient}", signers_info
         )
         
-        bundler_result = self.bundler_client.send_user_operation(signed_user_operation)
+        bundler_result = await self.bundler_client.send_user_operation(signed_user_operation)
         
         # Return result
         return self._format_transfer_result(bundler_result, recipient, amount_eth)
 
-    def _validate_balance(self, amount_wei: int, amount_eth: float) -> None:
+    async def _validate_balance(self, amount_wei: int, amount_eth: str) -> None:
         """Validate sufficient balance for transfer"""
-        smart_account_checksum = self.web3.to_checksum_address(self.config.smart_account_address)
-        balance_wei = self.web3.eth.get_balance(smart_account_checksum)
+        balance_wei = await asyncio.to_thread(self.web3.eth.get_balance, self._smart_account_checksum)
         balance_eth = self.web3.from_wei(balance_wei, 'ether')
         
         logger.info(f"Sending {amount_eth} ETH (balance: {balance_eth} ETH)")
@@ -64,7 +97,9 @@ class TacoSmartWalletService:
         if balance_wei < amount_wei:
             raise Exception(f"Insufficient balance: {balance_eth} ETH < {amount_eth} ETH")
 
-    def _optimize_gas_settings(self, op: UserOperation) -> UserOperation:
+    def _optimize_gas_settings(
+        self, op: UserOperation, gas_prices: Optional[Dict], gas_estimates: Optional[Dict]
+    ) -> UserOperation:
         """Create new UserOperation with optimized gas settings from Pimlico"""
         # Get current values from user_operation
         max_fee_per_gas = op.max_fee_per_gas
@@ -74,7 +109,6 @@ class TacoSmartWalletService:
         pre_verification_gas = op.pre_verification_gas
 
         # Update gas prices
-        gas_prices = self.bundler_client.get_user_operation_gas_price()
         if gas_prices and 'fast' in gas_prices:
             fast_prices = gas_prices['fast']
             if 'maxFeePerGas' in fast_prices:
@@ -83,7 +117,6 @@ class TacoSmartWalletService:
                 max_priority_fee_per_gas = int(fast_prices['maxPriorityFeePerGas'], 16)
 
         # Update gas limits with estimates
-        gas_estimates = self.bundler_client.estimate_user_operation_gas(op)
         if gas_estimates:
             if 'callGasLimit' in gas_estimates:
                 call_gas_limit = int(gas_estimates['callGasLimit'], 16)
@@ -112,7 +145,7 @@ class TacoSmartWalletService:
             paymaster_data=op.paymaster_data,
         )
 
-    def _format_transfer_result(self, bundler_result: Dict, recipient: str, amount_eth: float) -> Dict:
+    def _format_transfer_result(self, bundler_result: Dict, recipient: str, amount_eth: str) -> Dict:
         """Format the transfer result for consistent response"""
         base_result = {
             'smart_account': self.config.smart_account_address,
@@ -137,30 +170,19 @@ class TacoSmartWalletService:
                 'success': False
             }
 
-    def _get_nonce(self) -> int:
+    async def _get_nonce(self) -> int:
         """Get current nonce for smart account from EntryPoint"""
-        get_nonce_abi = [{
-            "inputs": [{"name": "sender", "type": "address"}, {"name": "key", "type": "uint192"}],
-            "name": "getNonce",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "stateMutability": "view",
-            "type": "function"
-        }]
-        
-        entry_point_contract = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(self.config.entry_point_address),
-            abi=get_nonce_abi
+        nonce = await asyncio.to_thread(
+            self._entry_point_contract.functions.getNonce(
+                self._smart_account_checksum,
+                0  # Default key
+            ).call
         )
         
-        nonce = entry_point_contract.functions.getNonce(
-            self.web3.to_checksum_address(self.config.smart_account_address),
-            0  # Default key
-        ).call()
-        
         logger.info(f"Current nonce: {nonce}")
         return nonce
 
 
 def create_taco_smart_wallet_service() -> TacoSmartWalletService:
     """Create a TACo Smart Wallet service with default configuration"""
-    return TacoSmartWalletService(SmartAccountConfig()) 
\ No newline at end of file
+    return TacoSmartWalletService(get_config()) 
\ No newline at end of file
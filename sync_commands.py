@@ -1,5 +1,8 @@
+import hashlib
+import json
 import requests
 import os
+from requests.adapters import HTTPAdapter
 
 # Discord application credentials from environment variables
 APPLICATION_ID = os.environ.get('DISCORD_APPLICATION_ID')
@@ -10,6 +13,10 @@ if not APPLICATION_ID:
 if not BOT_TOKEN:
     raise ValueError("DISCORD_BOT_TOKEN environment variable is required")
 
+# Shared session so Discord API calls reuse one keep-alive connection
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # The command definition
 commands = [
     {
@@ -32,6 +39,22 @@ commands = [
     }
 ]
 
+def _project(template, value):
+    # Keep only the fields the local definition sets; Discord adds ids, versions and defaults
+    if isinstance(template, dict) and isinstance(value, dict):
+        return {key: _project(template[key], value.get(key)) for key in template}
+    if isinstance(template, list) and isinstance(value, list) and len(template) == len(value):
+        return [_project(t, v) for t, v in zip(template, value)]
+    return value
+
+def commands_digest(command_list, template=None):
+    # Canonical hash of a command list, comparable between local and registered commands
+    command_list = sorted(command_list, key=lambda cmd: cmd.get("name", ""))
+    if template is not None:
+        template = sorted(template, key=lambda cmd: cmd["name"])
+        command_list = _project(template, command_list)
+    return hashlib.blake2b(json.dumps(command_list, sort_keys=True).encode()).digest()
+
 def sync_commands():
     # Discord API endpoint for application commands
     url = f"https://discord.com/api/v10/applications/{APPLICATION_ID}/commands"
@@ -43,8 +66,17 @@ def sync_commands():
     }
 
     try:
+        # Skip the PUT, and Discord's command propagation delay, when nothing changed
+        response = session.get(url, headers=headers)
+        response.raise_for_status()
+        if commands_digest(response.json(), template=commands) == commands_digest(commands):
+            print("Commands already up to date:")
+            for cmd in commands:
+                print(f"- /{cmd['name']}: {cmd['description']}")
+            return
+
         # Send the request to Discord
-        response = requests.put(url, headers=headers, json=commands)
+        response = session.put(url, headers=headers, json=commands)
         response.raise_for_status()
         
         # Print the response
@@ -0,0 +1,6 @@
+import os
+
+# app.py decodes the Discord verify key at import; any valid Ed25519 public key works for tests
+os.environ.setdefault(
+    "DISCORD_BOT_PUBLIC_KEY", "d75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a"
+)
@@ -0,0 +1,30 @@
+"""
+Checks tip amount validation against the wei value that is actually transferred
+"""
+
+import pytest
+
+from app import parse_tip_request
+
+RECIPIENT = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
+
+
+@pytest.mark.parametrize("amount", [
+    "100.0000000000000001",  # 100 ETH + 100 wei, over the safety limit
+    "0.0000000000000000001",  # positive but rounds down to 0 wei
+    "nan",
+    "inf",
+    "abc",
+])
+def test_parse_tip_request_rejects_invalid_amounts(amount):
+    assert "error" in parse_tip_request(amount, RECIPIENT)
+
+
+@pytest.mark.parametrize("amount, amount_wei", [
+    ("0.1", 10**17),
+    ("0.000000000000000001", 1),
+    ("100", 100 * 10**18),
+])
+def test_parse_tip_request_passes_exact_wei_amount(amount, amount_wei):
+    tip_data = parse_tip_request(amount, RECIPIENT)
+    assert tip_data["amount_wei"] == amount_wei
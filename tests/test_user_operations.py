@@ -0,0 +1,28 @@
+"""
+Checks the hand-built ETH transfer calldata against eth_abi's encoder
+"""
+
+import pytest
+from eth_abi import encode
+
+from user_operations import EXECUTE_SELECTOR, create_eth_transfer_user_operation
+
+SMART_ACCOUNT = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.mark.parametrize("recipient, amount_wei", [
+    ("0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045", 10**17),
+    ("0xd8da6bf26964af9d7eed9e03e53415d37aa96045", 10**17),
+    ("0x0000000000000000000000000000000000000001", 0),
+    ("0xFFfFfFffFFfffFFfFFfFFFFFffFFFffffFfFFFfF", 2**256 - 1),
+])
+def test_eth_transfer_call_data_matches_abi_encoding(recipient, amount_wei):
+    user_operation = create_eth_transfer_user_operation(
+        smart_account=SMART_ACCOUNT,
+        to_address=recipient,
+        amount_wei=amount_wei,
+        nonce=0
+    )
+
+    expected = EXECUTE_SELECTOR + encode(['(address,uint256,bytes)'], [(recipient, amount_wei, b'')])
+    assert bytes(user_operation.call_data) == expected
@@ -5,7 +5,6 @@ UserOperation creation utilities for TACo Smart Wallets
 import logging
 from dataclasses import dataclass
 from web3 import Web3
-from eth_abi import encode
 from nucypher_core import UserOperation
 
 from config import DEFAULT_GAS_LIMITS
@@ -20,7 +19,12 @@ class SignedUserOperation:
     signature: bytes
 
 # Function selector for execute((address,uint256,bytes))
-EXECUTE_SELECTOR = Web3.keccak(text="execute((address,uint256,bytes))")[:4]
+EXECUTE_SELECTOR = bytes(Web3.keccak(text="execute((address,uint256,bytes))")[:4])
+
+# Fixed ABI words around the (address,uint256,bytes) tuple when the bytes member is empty:
+# offset to the tuple, then offset to the bytes member within it and its zero length
+_EXECUTE_TUPLE_OFFSET = (0x20).to_bytes(32, 'big')
+_EMPTY_BYTES_TAIL = (0x60).to_bytes(32, 'big') + (0).to_bytes(32, 'big')
 
 
 def create_eth_transfer_user_operation(
@@ -31,12 +35,17 @@ def create_eth_transfer_user_operation(
 ) -> UserOperation:
     """Create ETH transfer UserOperation using tuple-based execute function"""
     
-    # Encode execute((address,uint256,bytes)) call
-    encoded_params = encode(
-        ['(address,uint256,bytes)'], 
-        [(Web3.to_checksum_address(to_address), amount_wei, b'')]
+    # Encode execute((address,uint256,bytes)) call; the layout is fixed for plain ETH transfers
+    address_bytes = bytes.fromhex(to_address.removeprefix("0x"))
+    if len(address_bytes) != 20:
+        raise ValueError(f"Invalid recipient address: {to_address}")
+    calldata = (
+        EXECUTE_SELECTOR
+        + _EXECUTE_TUPLE_OFFSET
+        + address_bytes.rjust(32, b'\x00')
+        + amount_wei.to_bytes(32, 'big')
+        + _EMPTY_BYTES_TAIL
     )
-    calldata = EXECUTE_SELECTOR + encoded_params
     
     logger.info(f"Created ETH transfer: {amount_wei} wei to {to_address}")
     